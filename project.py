@@ -1,13 +1,62 @@
 import json
+import math
+import numbers
 import os
+import stat
+import sys
+import tempfile
 from datetime import datetime
-from typing import Any, Dict, List, Optional
+from operator import itemgetter
+from typing import Any, Dict, Iterable, List, Optional, Tuple
 
 try:
-    # Optional pretty table; CLI will degrade gracefully if missing
-    from tabulate import tabulate  # type: ignore
+    # Optional fast JSON encoder/parser; falls back to the stdlib json module
+    import orjson  # type: ignore
 except Exception:  # pragma: no cover - optional dependency
-    tabulate = None  # type: ignore
+    orjson = None  # type: ignore
+
+
+def _loads(data: bytes) -> Any:
+    """Parse JSON bytes (no separate text-decoding pass), preferring orjson.
+
+    orjson rejects the NaN/Infinity tokens that the stdlib json module writes, so anything it
+    cannot parse is retried with json.loads before being treated as corrupt.
+    """
+    if orjson is not None:
+        try:
+            return orjson.loads(data)
+        except ValueError:  # orjson.JSONDecodeError
+            pass
+    return json.loads(data)
+
+
+# Heavier optional modules are imported on first use (see _numpy, _require_pyarrow, _tabulate)
+# so that starting the CLI and add-only flows don't pay for them.
+np: Any = None  # numpy: needed only by format_currency_array
+_np_tried = False
+pa: Any = None  # pyarrow: enables the Arrow IPC (.arrow) data file format
+tabulate: Any = None  # tabulate: optional pretty table; CLI degrades gracefully if missing
+_tabulate_tried = False
+
+
+def _numpy() -> Any:
+    """Import numpy on first use; return None if it is not installed."""
+    global np, _np_tried
+    if not _np_tried:
+        _np_tried = True
+        try:
+            import numpy  # type: ignore
+        except Exception:  # pragma: no cover - optional dependency
+            numpy = None  # type: ignore
+        np = numpy
+    return np
+
+
+# Parsed transactions per file, tagged with the file's (st_mtime_ns, st_size) so that edits
+# made outside this process invalidate the entry. Each entry is a dict:
+#   {"stamp": ..., "transactions": [...], "agg": dict or None, "max_id": int or None}
+# where agg and max_id are derived lazily and None until first needed.
+_CACHE: Dict[str, Dict[str, Any]] = {}
 
 
 def _ensure_data_shape(obj: Any) -> Dict[str, List[Dict[str, Any]]]:
@@ -20,47 +69,332 @@ def _ensure_data_shape(obj: Any) -> Dict[str, List[Dict[str, Any]]]:
     return {"transactions": txs}
 
 
-def load_data(filename: str = "data.json") -> Dict[str, List[Dict[str, Any]]]:
-    """Load data from JSON; on missing/corrupt file return empty structure.
+def _is_jsonl(filename: str) -> bool:
+    """Files ending in ``.jsonl`` are stored as an append-only log, one transaction per line."""
+    return filename.endswith(".jsonl")
 
-    Returns: {"transactions": [ ... ]}
+
+def _is_arrow(filename: str) -> bool:
+    """Files ending in ``.arrow`` are stored as an Arrow IPC file (requires pyarrow)."""
+    return filename.endswith(".arrow")
+
+
+def _require_pyarrow() -> Any:
+    """Import pyarrow on first use; raise RuntimeError if it is not installed."""
+    global pa
+    if pa is None:
+        try:
+            import pyarrow  # type: ignore
+        except Exception as exc:  # pragma: no cover - optional dependency
+            raise RuntimeError("pyarrow is required for .arrow data files") from exc
+        pa = pyarrow
+    return pa
+
+
+def _arrow_schema() -> Any:
+    return pa.schema(
+        [
+            ("id", pa.int64()),
+            ("timestamp", pa.string()),
+            ("amount", pa.float64()),
+            ("category", pa.string()),
+            ("type", pa.string()),
+            ("note", pa.string()),
+        ]
+    )
+
+
+def _read_arrow(filename: str) -> List[Dict[str, Any]]:
+    # Memory-mapped read avoids an extra read() copy of the file; to_pylist then converts every
+    # row to Python objects, since the rest of the module works on transaction dicts
+    with pa.memory_map(filename, "r") as source:
+        return pa.ipc.open_file(source).read_all().to_pylist()
+
+
+def _arrow_row(t: Dict[str, Any]) -> Dict[str, Any]:
+    """Coerce a (possibly legacy or hand-edited) transaction to the Arrow schema's types."""
+
+    def text(value: Any) -> Optional[str]:
+        return None if value is None else str(value)
+
+    tx_id = t.get("id")
+    return {
+        "id": None if tx_id is None else int(tx_id),
+        "timestamp": text(t.get("timestamp")),
+        "amount": float(t.get("amount", 0) or 0),
+        "category": text(t.get("category")),
+        "type": text(t.get("type")),
+        "note": str(t.get("note") or ""),
+    }
+
+
+def _encode_arrow(transactions: List[Dict[str, Any]]) -> bytes:
+    schema = _arrow_schema()
+    rows = []
+    for t in transactions:
+        try:
+            rows.append(_arrow_row(t))
+        except (AttributeError, TypeError, ValueError) as exc:
+            raise ValueError(f"transaction {t!r} cannot be stored in an .arrow file: {exc}") from exc
+    table = pa.Table.from_pylist(rows, schema=schema)
+    sink = pa.BufferOutputStream()
+    with pa.ipc.new_file(sink, schema) as writer:
+        writer.write_table(table)
+    return sink.getvalue().to_pybytes()
+
+
+def _encode(obj: Any, pretty: bool = False) -> bytes:
+    """Serialize obj to UTF-8 JSON bytes in a single call."""
+    if orjson is not None:
+        try:
+            payload = orjson.dumps(obj, option=orjson.OPT_INDENT_2 if pretty else 0)
+        except TypeError:  # orjson.JSONEncodeError; let stdlib json handle it
+            payload = None
+        # orjson silently writes NaN/Infinity as null; re-encode with json in that (rare) case
+        if payload is not None and b"null" not in payload:
+            return payload
+    if pretty:
+        text = json.dumps(obj, ensure_ascii=False, indent=2)
+    else:
+        text = json.dumps(obj, ensure_ascii=False, separators=(",", ":"))
+    return text.encode("utf-8")
+
+
+def _read_jsonl(filename: str) -> List[Dict[str, Any]]:
+    txs: List[Dict[str, Any]] = []
+    with open(filename, "rb") as f:
+        for line in f:
+            line = line.strip()
+            if not line:
+                continue
+            try:
+                tx = _loads(line)
+            except ValueError:  # e.g. a torn line from an interrupted append
+                continue
+            if isinstance(tx, dict):
+                txs.append(tx)
+    return txs
+
+
+def _append_jsonl(filename: str, txs: List[Dict[str, Any]]) -> None:
+    """Append txs to a ``.jsonl`` log in one write, first ending an unterminated last line."""
+    payload = b"".join(_encode(t) + b"\n" for t in txs)
+    with open(filename, "a+b") as f:
+        if f.seek(0, os.SEEK_END) > 0:
+            f.seek(-1, os.SEEK_END)
+            if f.read(1) != b"\n":
+                payload = b"\n" + payload
+        f.write(payload)
+
+
+def _file_stamp(filename: str) -> Optional[Tuple[int, int]]:
+    try:
+        st = os.stat(filename)
+    except OSError:
+        return None
+    return (st.st_mtime_ns, st.st_size)
+
+
+def _copy_txs(txs: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """Shallow-copy each transaction so cached dicts are never shared with callers."""
+    return [dict(t) if isinstance(t, dict) else t for t in txs]
+
+
+def _new_entry(stamp: Optional[Tuple[int, int]], transactions: List[Dict[str, Any]]) -> Dict[str, Any]:
+    return {"stamp": stamp, "transactions": transactions, "agg": None, "max_id": None}
+
+
+def _remember(
+    filename: str,
+    transactions: List[Dict[str, Any]],
+    agg: Optional[Dict[str, Any]] = None,
+    max_id: Optional[int] = None,
+) -> None:
+    """Record transactions just written to filename in the cache."""
+    stamp = _file_stamp(filename)
+    if stamp is None:
+        _CACHE.pop(filename, None)
+    else:
+        entry = _new_entry(stamp, transactions)
+        entry["agg"] = agg
+        entry["max_id"] = max_id
+        _CACHE[filename] = entry
+
+
+def _intern_fields(txs: List[Dict[str, Any]]) -> None:
+    """Share one str object per distinct type/category value, in place.
+
+    Decoders create a new str for every occurrence; interning keeps a single copy of each
+    (low-cardinality) value and lets equality checks short-circuit on identity.
     """
+    intern = sys.intern
+    for t in txs:
+        if not isinstance(t, dict):
+            continue
+        kind = t.get("type")
+        if isinstance(kind, str):
+            t["type"] = intern(kind)
+        cat = t.get("category")
+        if isinstance(cat, str):
+            t["category"] = intern(cat)
+
+
+def _cache_entry(filename: str) -> Dict[str, Any]:
+    stamp = _file_stamp(filename)
+    if stamp is None:
+        _CACHE.pop(filename, None)
+        return _new_entry(None, [])
+    cached = _CACHE.get(filename)
+    if cached is not None and cached["stamp"] == stamp:
+        return cached
+    if _is_arrow(filename):
+        _require_pyarrow()
     try:
-        if not os.path.exists(filename):
-            return {"transactions": []}
-        with open(filename, "r", encoding="utf-8") as f:
-            data = json.load(f)
-        return _ensure_data_shape(data)
+        if _is_arrow(filename):
+            txs = _read_arrow(filename)
+        elif _is_jsonl(filename):
+            txs = _read_jsonl(filename)
+        else:
+            with open(filename, "rb") as f:
+                txs = _ensure_data_shape(_loads(f.read()))["transactions"]
     except Exception:
-        return {"transactions": []}
+        txs = []
+    _intern_fields(txs)
+    entry = _new_entry(stamp, txs)
+    _CACHE[filename] = entry
+    return entry
+
+
+def _read_transactions(filename: str) -> List[Dict[str, Any]]:
+    """Return the (cached) parsed transactions of filename; callers must not mutate the list."""
+    return _cache_entry(filename)["transactions"]
 
 
-def save_data(data: Dict[str, List[Dict[str, Any]]], filename: str = "data.json") -> None:
-    """Persist data dict to JSON file."""
+def _agg_add(agg: Dict[str, Any], t: Dict[str, Any]) -> None:
+    """Fold one transaction into the running aggregates."""
+    kind = t.get("type")
+    if kind == "income" or kind == "expense":
+        amt = float(t.get("amount", 0) or 0)
+        agg["balance"] += amt if kind == "income" else -amt
+        cat = str(t.get("category", "Uncategorized") or "Uncategorized")
+        totals = agg[kind]
+        totals[cat] = round(totals.get(cat, 0.0) + amt, 2)
+
+
+def _compute_agg(txs: List[Dict[str, Any]]) -> Dict[str, Any]:
+    # A sequential fold on purpose: category totals are rounded after every addition, which a
+    # vectorized sum cannot reproduce, and the same _agg_add keeps incremental updates consistent
+    agg: Dict[str, Any] = {"balance": 0.0, "income": {}, "expense": {}}
+    for t in txs:
+        _agg_add(agg, t)
+    return agg
+
+
+def _aggregates(filename: str) -> Dict[str, Any]:
+    """Return balance and per-category totals for filename, computed once per file version.
+
+    Shape: {"balance": float, "income": {cat: total}, "expense": {cat: total}}
+    """
+    entry = _cache_entry(filename)
+    if entry["agg"] is None:
+        entry["agg"] = _compute_agg(entry["transactions"])
+    return entry["agg"]
+
+
+def load_data(filename: str = "data.json") -> Dict[str, List[Dict[str, Any]]]:
+    """Load data from JSON (or a ``.jsonl`` log / ``.arrow`` file); on missing/corrupt file return empty structure.
+
+    Parsed data is cached per file and reused until the file changes on disk.
+
+    Returns: {"transactions": [ ... ]}
+    """
+    return {"transactions": _copy_txs(_read_transactions(filename))}
+
+
+def _umask() -> int:
+    mask = os.umask(0)
+    os.umask(mask)
+    return mask
+
+
+def save_data(
+    data: Dict[str, List[Dict[str, Any]]],
+    filename: str = "data.json",
+    pretty: bool = False,
+    fsync: bool = False,
+) -> None:
+    """Persist data dict to JSON file.
+
+    Output is compact by default; pass ``pretty=True`` for indented, human-readable JSON.
+    For ``.jsonl`` files this rewrites (compacts) the log, one transaction per line. For
+    ``.arrow`` files only the standard transaction fields are stored.
+
+    The file is replaced atomically (written to a temporary file in the same directory, then
+    renamed), so a crash mid-write leaves the previous contents intact. The file's permission
+    bits are kept, and if filename is a symlink its target is replaced, not the link. Pass
+    ``fsync=True`` to also flush the new contents to disk before the rename.
+    """
     safe = _ensure_data_shape(data)
-    with open(filename, "w", encoding="utf-8") as f:
-        json.dump(safe, f, ensure_ascii=False, indent=2)
+    # Encode once and write once instead of json.dump's many small writes
+    if _is_arrow(filename):
+        _require_pyarrow()
+        payload = _encode_arrow(safe["transactions"])
+    elif _is_jsonl(filename):
+        payload = b"".join(_encode(t) + b"\n" for t in safe["transactions"])
+    else:
+        payload = _encode(safe, pretty)
+    target = os.path.realpath(filename)
+    try:
+        mode = stat.S_IMODE(os.stat(target).st_mode)
+    except OSError:  # new file: what open() would have created
+        mode = 0o666 & ~_umask()
+    fd, tmp = tempfile.mkstemp(prefix=os.path.basename(target) + ".", suffix=".tmp", dir=os.path.dirname(target))
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(payload)
+            if fsync:
+                f.flush()
+                os.fsync(f.fileno())
+        os.chmod(tmp, mode)
+        os.replace(tmp, target)
+    except BaseException:
+        try:
+            os.remove(tmp)
+        except OSError:
+            pass
+        raise
+    _remember(filename, _copy_txs(safe["transactions"]))
+
+
+def _next_id(filename: str) -> int:
+    """Return max existing id + 1; the max is computed once per file version, then kept current."""
+    entry = _cache_entry(filename)
+    if entry["max_id"] is None:
+        # Don't trust list order: save_data is public and the file may be edited by hand
+        entry["max_id"] = max((int(t.get("id", 0)) for t in entry["transactions"]), default=0)
+    return entry["max_id"] + 1
 
 
-def _next_id(transactions: List[Dict[str, Any]]) -> int:
-    if not transactions:
-        return 1
-    return max(int(t.get("id", 0)) for t in transactions) + 1
+_VALID_TYPES = frozenset(("income", "expense"))
 
 
-def _validate_tx_inputs(amount: Any, category: Any, tx_type: Any) -> None:
-    if not (isinstance(amount, (int, float)) or (isinstance(amount, str) and amount.strip() != "")):
+def _validate_tx_inputs(amount: Any, category: Any, tx_type: Any) -> float:
+    """Validate transaction inputs and return the amount as a float."""
+    if not isinstance(amount, (str, numbers.Real)):
         raise ValueError("amount must be a number > 0")
     try:
         amt = float(amount)
-    except Exception as exc:
+    except (TypeError, ValueError) as exc:
         raise ValueError("amount must be numeric") from exc
+    if not math.isfinite(amt):
+        raise ValueError("amount must be a finite number")
     if amt <= 0:
         raise ValueError("amount must be > 0")
-    if not isinstance(category, str) or not category.strip():
+    if not (isinstance(category, str) and category.strip()):
         raise ValueError("category must be a non-empty string")
-    if tx_type not in ("income", "expense"):
+    if not (isinstance(tx_type, str) and tx_type in _VALID_TYPES):
         raise ValueError("tx_type must be 'income' or 'expense')")
+    return amt
 
 
 def add_transaction(
@@ -69,105 +403,171 @@ def add_transaction(
     tx_type: str,
     note: str = "",
     filename: str = "data.json",
+    pretty: bool = False,
 ) -> Dict[str, Any]:
     """Validate and append a transaction; return created transaction dict."""
-    _validate_tx_inputs(amount, category, tx_type)
-    amount_f = float(amount)
-
-    data = load_data(filename)
-    transactions = data.get("transactions", [])
-    new_tx = {
-        "id": _next_id(transactions),
-        "timestamp": datetime.now().replace(microsecond=0).isoformat(),
-        "amount": amount_f,
-        "category": category.strip(),
-        "type": tx_type,
-        "note": note or "",
-    }
-    transactions.append(new_tx)
-    save_data({"transactions": transactions}, filename)
-    return new_tx
+    item = {"amount": amount, "category": category, "type": tx_type, "note": note}
+    return add_transactions([item], filename, pretty=pretty)[0]
 
 
-def get_balance(filename: str = "data.json") -> float:
-    data = load_data(filename)
-    balance = 0.0
-    for t in data.get("transactions", []):
-        amt = float(t.get("amount", 0) or 0)
-        if t.get("type") == "income":
-            balance += amt
-        elif t.get("type") == "expense":
-            balance -= amt
-    return round(balance, 2)
+def add_transactions(
+    items: Iterable[Dict[str, Any]],
+    filename: str = "data.json",
+    pretty: bool = False,
+) -> List[Dict[str, Any]]:
+    """Validate and append several transactions with one load and one save; return the created dicts.
 
+    Each item is a dict with "amount", "category" and "type" keys and optional "note" and
+    "timestamp". Every item is validated before anything is written.
+    """
+    next_id = _next_id(filename)
+    entry = _cache_entry(filename)
+    agg = entry["agg"]
+    cached = entry["transactions"]
+    now = None
+    new_txs: List[Dict[str, Any]] = []
+    for item in items:
+        amount_f = _validate_tx_inputs(item.get("amount"), item.get("category"), item.get("type"))
+        timestamp = item.get("timestamp")
+        if not timestamp:
+            if now is None:
+                now = datetime.now().replace(microsecond=0).isoformat()
+            timestamp = now
+        new_txs.append(
+            {
+                "id": next_id + len(new_txs),
+                "timestamp": timestamp,
+                "amount": amount_f,
+                # str() first: sys.intern rejects str subclasses, which validation accepts
+                "category": sys.intern(str(item["category"]).strip()),
+                "type": sys.intern(str(item["type"])),
+                "note": item.get("note") or "",
+            }
+        )
+    if not new_txs:
+        return new_txs
+    # The cache keeps its own copies of the new dicts; the originals go back to the caller
+    transactions = cached + _copy_txs(new_txs)
+    if _is_jsonl(filename):
+        # Append-only log: one write instead of rewriting the whole file
+        _append_jsonl(filename, new_txs)
+    else:
+        save_data({"transactions": transactions}, filename, pretty=pretty)
+    # Keep already-computed aggregates current instead of rescanning on the next query
+    if agg is not None:
+        for t in new_txs:
+            _agg_add(agg, t)
+    _remember(filename, transactions, agg, max_id=new_txs[-1]["id"])
+    return new_txs
 
-def get_summary_by_category(filename: str = "data.json", tx_type: str = "expense") -> Dict[str, Any]:
-    data = load_data(filename)
-    txs = data.get("transactions", [])
 
-    def summarize(kind: str) -> Dict[str, float]:
-        summary: Dict[str, float] = {}
-        for t in txs:
-            if t.get("type") != kind:
-                continue
-            cat = str(t.get("category", "Uncategorized") or "Uncategorized")
-            summary[cat] = round(summary.get(cat, 0.0) + float(t.get("amount", 0) or 0), 2)
-        return summary
+def get_balance(filename: str = "data.json") -> float:
+    return round(_aggregates(filename)["balance"], 2)
 
+
+def get_summary_by_category(filename: str = "data.json", tx_type: str = "expense") -> Dict[str, Any]:
+    agg = _aggregates(filename)
     if tx_type == "both":
-        return {"income": summarize("income"), "expense": summarize("expense")}
+        return {"income": dict(agg["income"]), "expense": dict(agg["expense"])}
     if tx_type not in ("income", "expense"):
         raise ValueError("tx_type must be 'income', 'expense', or 'both'")
-    return summarize(tx_type)
+    return dict(agg[tx_type])
+
+
+def split_by_type(txs: List[Dict[str, Any]]) -> Tuple[List[Dict[str, Any]], List[Dict[str, Any]]]:
+    """Partition txs into (income, expense) lists in a single pass; other types are dropped."""
+    income: List[Dict[str, Any]] = []
+    expense: List[Dict[str, Any]] = []
+    for t in txs:
+        kind = t.get("type")
+        if kind == "income":
+            income.append(t)
+        elif kind == "expense":
+            expense.append(t)
+    return income, expense
 
 
 def list_transactions(limit: Optional[int] = None, filename: str = "data.json") -> List[Dict[str, Any]]:
-    data = load_data(filename)
-    txs = list(data.get("transactions", []))
-    if limit is not None:
-        try:
-            n = int(limit)
-        except Exception as exc:
-            raise ValueError("limit must be an integer or None") from exc
-        if n < 0:
-            raise ValueError("limit must be >= 0")
-        txs = txs[-n:] if n > 0 else []
-    return txs
+    if limit is None:
+        # load_data already hands out a fresh list
+        return load_data(filename)["transactions"]
+    try:
+        n = int(limit)
+    except Exception as exc:
+        raise ValueError("limit must be an integer or None") from exc
+    if n < 0:
+        raise ValueError("limit must be >= 0")
+    # Slice the cached list directly; only the last n entries are copied
+    return _copy_txs(_read_transactions(filename)[-n:]) if n > 0 else []
 
 
 def format_currency(amount: float) -> str:
-    sign = "-" if amount < 0 else ""
-    return f"{sign}${abs(float(amount)):.2f}"
+    return ("-$%.2f" if amount < 0 else "$%.2f") % abs(amount)
+
+
+def format_currency_array(amounts: Any) -> Any:
+    """Apply format_currency to every element of a NumPy array; returns an array of strings.
+
+    A convenience for callers already holding amounts in an array. np.char.mod still formats
+    element by element, so this is not faster than a list comprehension over format_currency.
+    """
+    if _numpy() is None:
+        raise RuntimeError("numpy is required for format_currency_array")
+    amounts = np.asarray(amounts, dtype=np.float64)
+    text = np.char.mod("$%.2f", np.abs(amounts))
+    return np.where(amounts < 0, np.char.add("-", text), text)
+
+
+def _tabulate() -> Any:
+    """Import tabulate on first use; return None if it is not installed."""
+    global tabulate, _tabulate_tried
+    if not _tabulate_tried:
+        _tabulate_tried = True
+        try:
+            from tabulate import tabulate  # type: ignore
+        except Exception:  # pragma: no cover - optional dependency
+            tabulate = None  # type: ignore
+    return tabulate
 
 
 def _print_table(rows: List[List[Any]], headers: List[str]) -> None:
+    tabulate = _tabulate()
     if tabulate:
         print(tabulate(rows, headers=headers, tablefmt="github"))
     else:  # fallback plain table
-        widths = [len(h) for h in headers]
-        for row in rows:
-            for i, col in enumerate(row):
-                widths[i] = max(widths[i], len(str(col)))
-        line = "+".join("-" * (w + 2) for w in widths)
-        print(" ".join(h.ljust(w) for h, w in zip(headers, widths)))
-        print(line)
-        for row in rows:
-            print(" ".join(str(c).ljust(w) for c, w in zip(row, widths)))
+        cells = [[str(c) for c in row] for row in rows]
+        widths = [max(map(len, col)) for col in zip(headers, *cells)]
+        lines = [" ".join(h.ljust(w) for h, w in zip(headers, widths)), "+".join("-" * (w + 2) for w in widths)]
+        lines.extend(" ".join(c.ljust(w) for c, w in zip(row, widths)) for row in cells)
+        print("\n".join(lines))
 
 
-def _print_transactions_detailed(txs: List[Dict[str, Any]]) -> None:
-    rows = [
-        [
-            t.get("id"),
-            t.get("timestamp"),
-            format_currency(float(t.get("amount", 0) or 0)),
-            t.get("category"),
-            t.get("type"),
-            t.get("note", ""),
-        ]
-        for t in txs
+_TX_HEADERS = ["ID", "Timestamp", "Amount", "Category", "Type", "Note"]
+
+
+# Pulls all six fields of a well-formed transaction into a tuple in a single C-level call
+_tx_fields = itemgetter("id", "timestamp", "amount", "category", "type", "note")
+
+
+def _tx_row(t: Dict[str, Any]) -> Tuple[Any, ...]:
+    """Return (id, timestamp, amount, category, type, note) for t, tolerating missing keys."""
+    try:
+        return _tx_fields(t)
+    except KeyError:
+        return (t.get("id"), t.get("timestamp"), t.get("amount", 0), t.get("category"), t.get("type"), t.get("note", ""))
+
+
+def _transaction_rows(txs: List[Dict[str, Any]]) -> List[List[Any]]:
+    """Build display rows for txs, unpacking each transaction once via _tx_row."""
+    return [
+        [tx_id, timestamp, format_currency(float(amount or 0)), cat, kind, note]
+        for tx_id, timestamp, amount, cat, kind, note in map(_tx_row, txs)
     ]
-    _print_table(rows, ["ID", "Timestamp", "Amount", "Category", "Type", "Note"]) if rows else print("(none)")
+
+
+def _print_transactions_detailed(txs: List[Dict[str, Any]]) -> None:
+    rows = _transaction_rows(txs)
+    _print_table(rows, _TX_HEADERS) if rows else print("(none)")
 
 
 def main() -> None:
@@ -187,29 +587,27 @@ def main() -> None:
                 amt = input("Amount: ").strip()
                 cat = input("Category: ").strip()
                 note = input("Note (optional): ").strip()
-                tx = add_transaction(amt, cat, "income", note, filename)
+                tx = add_transaction(amt, cat, "income", note, filename, pretty=True)
                 print(f"Added income #{tx['id']} {format_currency(tx['amount'])} in {tx['category']}")
             elif choice == "2":
                 amt = input("Amount: ").strip()
                 cat = input("Category: ").strip()
                 note = input("Note (optional): ").strip()
-                tx = add_transaction(amt, cat, "expense", note, filename)
+                tx = add_transaction(amt, cat, "expense", note, filename, pretty=True)
                 print(f"Added expense #{tx['id']} {format_currency(tx['amount'])} in {tx['category']}")
             elif choice == "3":
                 lim_raw = input("Limit (blank for all): ").strip()
                 limit = int(lim_raw) if lim_raw else None
                 txs = list_transactions(limit, filename)
-                rows = [
-                    [t["id"], t["timestamp"], format_currency(t["amount"]), t["category"], t["type"], t.get("note", "")]
-                    for t in txs
-                ]
-                _print_table(rows, ["ID", "Timestamp", "Amount", "Category", "Type", "Note"])
+                _print_table(_transaction_rows(txs), _TX_HEADERS)
             elif choice == "4":
                 bal = get_balance(filename)
                 print(f"Balance: {format_currency(bal)}")
             elif choice == "5":
                 which = input("Type (income/expense/both): ").strip().lower() or "expense"
+                # Cached aggregates and one partitioning pass over the cached list; no re-parse or copy
                 summary = get_summary_by_category(filename, which)
+                inc_txs, exp_txs = split_by_type(_read_transactions(filename))
                 if which == "both":
                     print("Income by category:")
                     rows_i = [[k, format_currency(v)] for k, v in summary.get("income", {}).items()]
@@ -217,9 +615,6 @@ def main() -> None:
                     print("\nExpense by category:")
                     rows_e = [[k, format_currency(v)] for k, v in summary.get("expense", {}).items()]
                     _print_table(rows_e, ["Category", "Total"]) if rows_e else print("(none)")
-                    data_all = list_transactions(filename=filename)
-                    inc_txs = [t for t in data_all if t.get("type") == "income"]
-                    exp_txs = [t for t in data_all if t.get("type") == "expense"]
                     print("\nIncome transactions:")
                     _print_transactions_detailed(inc_txs)
                     print("\nExpense transactions:")
@@ -227,10 +622,8 @@ def main() -> None:
                 else:
                     rows = [[k, format_currency(v)] for k, v in summary.items()]
                     _print_table(rows, ["Category", "Total"]) if rows else print("(none)")
-                    data_all = list_transactions(filename=filename)
-                    kind_txs = [t for t in data_all if t.get("type") == which]
                     print("\nDetailed transactions:")
-                    _print_transactions_detailed(kind_txs)
+                    _print_transactions_detailed(inc_txs if which == "income" else exp_txs)
             elif choice == "6":
                 print("Goodbye!")
                 break
@@ -37,6 +37,9 @@ def test_add_transaction_validations_and_creation():
         proj.add_transaction(0, "Food", "expense", filename=tmp)
     with pytest.raises(ValueError):
         proj.add_transaction("abc", "Food", "expense", filename=tmp)
+    for bad in (b"5", "nan", "inf", float("inf"), None):
+        with pytest.raises(ValueError):
+            proj.add_transaction(bad, "Food", "expense", filename=tmp)
     with pytest.raises(ValueError):
         proj.add_transaction(10, "", "expense", filename=tmp)
     with pytest.raises(ValueError):
@@ -55,6 +58,176 @@ def test_add_transaction_validations_and_creation():
     assert len(data["transactions"]) == 2
 
 
+def _leftover_tmpfiles(path):
+    name = os.path.basename(path)
+    return [n for n in os.listdir(os.path.dirname(path)) if n.startswith(name + ".") and n.endswith(".tmp")]
+
+
+def test_save_data_replaces_file_atomically(monkeypatch):
+    tmp = make_tmpfile()
+    proj.save_data({"transactions": [{"id": 1}]}, tmp, fsync=True)
+    assert _leftover_tmpfiles(tmp) == []
+
+    def fail(*args, **kwargs):
+        raise OSError("disk full")
+
+    monkeypatch.setattr(proj.os, "replace", fail)
+    with pytest.raises(OSError):
+        proj.save_data({"transactions": [{"id": 1}, {"id": 2}]}, tmp)
+    assert _leftover_tmpfiles(tmp) == []
+    with open(tmp, "r", encoding="utf-8") as f:
+        assert json.load(f) == {"transactions": [{"id": 1}]}
+
+
+@pytest.mark.skipif(os.name != "posix", reason="POSIX permissions and symlinks")
+def test_save_data_keeps_mode_and_symlink():
+    tmp = make_tmpfile()
+    os.chmod(tmp, 0o600)
+    link = tmp + ".link.json"
+    os.symlink(tmp, link)
+    proj.save_data({"transactions": [{"id": 1}]}, link)
+    assert os.path.islink(link)
+    assert os.stat(tmp).st_mode & 0o777 == 0o600
+    assert proj.load_data(tmp) == {"transactions": [{"id": 1}]}
+
+
+def test_load_data_sees_external_edits():
+    tmp = make_tmpfile()
+    proj.save_data({"transactions": [{"id": 1}]}, tmp)
+    assert proj.load_data(tmp) == {"transactions": [{"id": 1}]}
+    with open(tmp, "w", encoding="utf-8") as f:
+        json.dump({"transactions": [{"id": 1}, {"id": 2}]}, f)
+    assert proj.load_data(tmp) == {"transactions": [{"id": 1}, {"id": 2}]}
+    # callers get their own list, not the cached one
+    proj.load_data(tmp)["transactions"].clear()
+    assert len(proj.load_data(tmp)["transactions"]) == 2
+
+
+def test_returned_transactions_do_not_alias_the_cache():
+    tmp = make_tmpfile()
+    data = {"transactions": [{"id": 1, "amount": 10.0, "category": "Food", "type": "expense"}]}
+    proj.save_data(data, tmp)
+    data["transactions"][0]["amount"] = 500.0
+    proj.load_data(tmp)["transactions"][0]["amount"] = 999.0
+    proj.list_transactions(1, filename=tmp)[0]["amount"] = 999.0
+    proj.add_transaction(5, "Food", "expense", filename=tmp)["amount"] = 999.0
+    assert [t["amount"] for t in proj.load_data(tmp)["transactions"]] == [10.0, 5.0]
+    assert proj.get_balance(tmp) == -15.0
+
+
+def test_legacy_non_finite_amounts_are_not_treated_as_corrupt():
+    tmp = make_tmpfile()
+    rows = [
+        {"id": 1, "amount": float("inf"), "category": "X", "type": "expense"},
+        {"id": 2, "amount": 5.0, "category": "Y", "type": "income"},
+    ]
+    with open(tmp, "w", encoding="utf-8") as f:
+        json.dump({"transactions": rows}, f)  # writes the Infinity token
+    assert [t["id"] for t in proj.load_data(tmp)["transactions"]] == [1, 2]
+    proj.add_transaction(1, "Z", "income", filename=tmp)
+    proj._CACHE.clear()
+    assert [t["id"] for t in proj.load_data(tmp)["transactions"]] == [1, 2, 3]
+    assert proj.load_data(tmp)["transactions"][0]["amount"] == float("inf")
+
+    tmpl = make_tmpfile() + "l"
+    with open(tmpl, "w", encoding="utf-8") as f:
+        f.write(json.dumps({"id": 1, "amount": float("nan"), "type": "expense"}) + "\n")
+    assert len(proj.load_data(tmpl)["transactions"]) == 1
+
+
+def test_jsonl_log_appends_and_compacts():
+    tmp = make_tmpfile() + "l"
+    proj.add_transaction(100, "Salary", "income", filename=tmp)
+    proj.add_transaction(40, "Groceries", "expense", filename=tmp)
+    with open(tmp, "r", encoding="utf-8") as f:
+        lines = f.read().splitlines()
+    assert [json.loads(line)["id"] for line in lines] == [1, 2]
+
+    # a torn trailing line is ignored
+    with open(tmp, "a", encoding="utf-8") as f:
+        f.write('{"id": 3, "amo')
+    data = proj.load_data(tmp)
+    assert [t["id"] for t in data["transactions"]] == [1, 2]
+    assert proj.get_balance(tmp) == 60.0
+
+    proj.save_data(data, tmp)
+    assert proj.load_data(tmp) == data
+
+
+def test_arrow_file_roundtrip():
+    pytest.importorskip("pyarrow")
+    tmp = make_tmpfile() + ".arrow"
+    proj.add_transaction(100, "Salary", "income", filename=tmp)
+    tx = proj.add_transaction(40, "Groceries", "expense", note="weekly", filename=tmp)
+    proj._CACHE.clear()
+    data = proj.load_data(tmp)
+    assert data["transactions"][-1] == tx
+    assert proj.get_balance(tmp) == 60.0
+    assert proj.add_transaction(1, "Coffee", "expense", filename=tmp)["id"] == 3
+
+
+def test_arrow_save_coerces_legacy_rows():
+    pytest.importorskip("pyarrow")
+    tmp = make_tmpfile() + ".arrow"
+    proj.save_data({"transactions": [{"id": "1", "amount": "5", "category": "Food", "type": "expense"}]}, tmp)
+    proj._CACHE.clear()
+    tx = proj.load_data(tmp)["transactions"][0]
+    assert (tx["id"], tx["amount"], tx["note"]) == (1, 5.0, "")
+    with pytest.raises(ValueError):
+        proj.save_data({"transactions": [{"id": 2, "amount": "abc"}]}, tmp)
+
+
+def test_add_transactions_batch():
+    tmp = make_tmpfile()
+    proj.add_transaction(100, "Salary", "income", filename=tmp)
+    with pytest.raises(ValueError):
+        proj.add_transactions(
+            [{"amount": 5, "category": "Food", "type": "expense"}, {"amount": -1, "category": "Food", "type": "expense"}],
+            filename=tmp,
+        )
+    assert len(proj.load_data(tmp)["transactions"]) == 1
+
+    created = proj.add_transactions(
+        [
+            {"amount": 5, "category": "Food", "type": "expense", "note": "snack"},
+            {"amount": "20", "category": " Rent ", "type": "expense", "timestamp": "2025-01-01T00:00:00"},
+        ],
+        filename=tmp,
+    )
+    assert [t["id"] for t in created] == [2, 3]
+    assert created[0]["note"] == "snack"
+    assert created[1]["category"] == "Rent"
+    assert created[1]["timestamp"] == "2025-01-01T00:00:00"
+    assert proj.load_data(tmp)["transactions"][1:] == created
+    assert proj.get_balance(tmp) == 75.0
+    assert proj.add_transactions([], filename=tmp) == []
+
+    class Label(str):
+        pass
+
+    tx = proj.add_transaction(1, Label("Food"), Label("expense"), filename=tmp)
+    assert (tx["category"], tx["type"]) == ("Food", "expense")
+    assert type(tx["type"]) is str
+
+
+def test_jsonl_append_after_unterminated_last_line():
+    tmp = make_tmpfile() + "l"
+    with open(tmp, "w", encoding="utf-8") as f:
+        f.write('{"id": 1, "amount": 10.0, "category": "Food", "type": "expense"}')
+    proj.add_transaction(5, "Food", "expense", filename=tmp)
+    proj._CACHE.clear()
+    assert [t["id"] for t in proj.load_data(tmp)["transactions"]] == [1, 2]
+
+
+def test_next_id_does_not_rely_on_list_order():
+    tmp = make_tmpfile()
+    proj.save_data({"transactions": [{"id": 5}, {"id": 2}]}, tmp)
+    assert proj.add_transaction(1, "Food", "expense", filename=tmp)["id"] == 6
+    assert proj.add_transaction(1, "Food", "expense", filename=tmp)["id"] == 7
+    proj._CACHE.clear()
+    assert proj.add_transaction(1, "Food", "expense", filename=tmp)["id"] == 8
+
+
 def test_get_balance_and_list_and_summary():
     tmp = make_tmpfile()
     proj.add_transaction(100, "Salary", "income", filename=tmp)
@@ -80,6 +253,11 @@ def test_get_balance_and_list_and_summary():
     both = proj.get_summary_by_category(tmp, "both")
     assert both == {"income": {"Salary": 100.0}, "expense": {"Groceries": 40.0, "Coffee": 10.0}}
 
+    txs = proj.load_data(tmp)["transactions"]
+    income, expense = proj.split_by_type(txs)
+    assert [t["category"] for t in income] == ["Salary"]
+    assert [t["category"] for t in expense] == ["Groceries", "Coffee"]
+
 
 def test_format_currency():
     assert proj.format_currency(0) == "$0.00"
@@ -87,3 +265,73 @@ def test_format_currency():
     assert proj.format_currency(-3.4) == "-$3.40"
 
 
+def test_format_currency_array():
+    np = pytest.importorskip("numpy")
+    values = [0, 12.5, -3.4, 1234.567]
+    assert proj.format_currency_array(np.array(values)).tolist() == [proj.format_currency(v) for v in values]
+
+
+def test_aggregates_stay_current_across_adds():
+    tmp = make_tmpfile()
+    proj.add_transaction(100, "Salary", "income", filename=tmp)
+    assert proj.get_balance(tmp) == 100.0
+    proj.add_transaction(30.5, "Food", "expense", filename=tmp)
+    proj.add_transaction(4.5, "Food", "expense", filename=tmp)
+    summary = proj.get_summary_by_category(tmp, "expense")
+    assert summary == {"Food": 35.0}
+    summary["Food"] = 0.0  # returned dicts are copies
+    assert proj.get_summary_by_category(tmp, "expense") == {"Food": 35.0}
+    assert proj.get_balance(tmp) == 65.0
+
+    # a cold rebuild agrees with the incrementally maintained values
+    proj._CACHE.clear()
+    assert proj.get_balance(tmp) == 65.0
+    assert proj.add_transaction(1, "Food", "expense", filename=tmp)["id"] == 4
+
+
+def test_transaction_rows_tolerate_missing_fields():
+    rows = proj._transaction_rows(
+        [
+            {"id": 1, "timestamp": "t", "amount": 2.5, "category": "Food", "type": "expense", "note": "x"},
+            {"id": 2, "amount": None, "type": "income"},
+        ]
+    )
+    assert rows == [[1, "t", "$2.50", "Food", "expense", "x"], [2, None, "$0.00", None, "income", ""]]
+
+
+def test_print_table_plain_fallback(monkeypatch, capsys):
+    import builtins
+
+    real_import = builtins.__import__
+    attempts = []
+
+    def no_tabulate(name, *args, **kwargs):
+        if name == "tabulate":
+            attempts.append(name)
+            raise ImportError(name)
+        return real_import(name, *args, **kwargs)
+
+    monkeypatch.setattr(builtins, "__import__", no_tabulate)
+    monkeypatch.setattr(proj, "tabulate", None)
+    monkeypatch.setattr(proj, "_tabulate_tried", False)
+    proj._print_table([[1, "Food"], [22, "Rent"]], ["ID", "Category"])
+    assert capsys.readouterr().out.splitlines() == [
+        "ID Category",
+        "----+----------",
+        "1  Food    ",
+        "22 Rent    ",
+    ]
+    proj._print_table([[1, "Food"]], ["ID", "Category"])
+    assert attempts == ["tabulate"]  # the failed import is not retried
+
+
+def test_category_totals_round_after_every_addition():
+    tmp = make_tmpfile()
+    proj.add_transactions([{"amount": 0.004, "category": "Tiny", "type": "expense"}] * 999, filename=tmp)
+    assert proj.get_summary_by_category(tmp, "expense") == {"Tiny": 0.0}
+    proj.add_transaction(0.004, "Tiny", "expense", filename=tmp)
+    assert proj.get_summary_by_category(tmp, "expense") == {"Tiny": 0.0}
+    # a cold rebuild of a large ledger follows the same rule as the incremental updates
+    proj._CACHE.clear()
+    assert proj.get_summary_by_category(tmp, "expense") == {"Tiny": 0.0}
+    assert proj.get_balance(tmp) == -4.0